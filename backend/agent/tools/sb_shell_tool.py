@@ -129,14 +129,9 @@ class SandboxShellTool(SandboxToolsBase):
             if not session_name:
                 session_name = f"session_{str(uuid4())[:8]}"
             
-            # Check if tmux session already exists
-            check_session = await self._execute_raw_command(f"tmux has-session -t {session_name} 2>/dev/null || echo 'not_exists'")
-            session_exists = "not_exists" not in check_session.get("output", "")
-            
-            if not session_exists:
-                # Create a new tmux session
-                await self._execute_raw_command(f"tmux new-session -d -s {session_name}")
-                
+            # Create the tmux session only if it doesn't already exist, in a single round trip
+            await self._execute_raw_command(f"tmux has-session -t {session_name} 2>/dev/null || tmux new-session -d -s {session_name}")
+
             # Ensure we're in the correct directory and send command to tmux
             full_command = f"cd {cwd} && {command}"
             wrapped_command = full_command.replace('"', '\\"')  # Escape double quotes
@@ -156,8 +151,9 @@ class SandboxShellTool(SandboxToolsBase):
                     if "ended" in check_result.get("output", ""):
                         break
                         
-                    # Get current output and check for common completion indicators
-                    output_result = await self._execute_raw_command(f"tmux capture-pane -t {session_name} -p -S - -E -")
+                    # Get the tail of the pane and check for common completion indicators
+                    # (only the last lines are inspected, so don't pull the whole scrollback on every poll)
+                    output_result = await self._execute_raw_command(f"tmux capture-pane -t {session_name} -p -S -3 -E -")
                     current_output = output_result.get("output", "")
                     
                     # Check for prompt indicators that suggest command completion
@@ -342,14 +338,11 @@ class SandboxShellTool(SandboxToolsBase):
             # Ensure sandbox is initialized
             await self._ensure_sandbox()
             
-            # Check if session exists
-            check_result = await self._execute_raw_command(f"tmux has-session -t {session_name} 2>/dev/null || echo 'not_exists'")
-            if "not_exists" in check_result.get("output", ""):
+            # Kill the session if it exists, in a single round trip
+            kill_result = await self._execute_raw_command(f"tmux has-session -t {session_name} 2>/dev/null && tmux kill-session -t {session_name} || echo 'not_exists'")
+            if "not_exists" in kill_result.get("output", ""):
                 return self.fail_response(f"Tmux session '{session_name}' does not exist.")
-            
-            # Kill the session
-            await self._execute_raw_command(f"tmux kill-session -t {session_name}")
-            
+
             return self.success_response({
                 "message": f"Tmux session '{session_name}' terminated successfully."
             })
@@ -1,3 +1,6 @@
+import asyncio
+from types import MappingProxyType
+
 from daytona_sdk import Daytona, DaytonaConfig, CreateSandboxParams, Sandbox, SessionExecuteRequest
 from daytona_api_client.models.workspace_state import WorkspaceState
 from dotenv import load_dotenv
@@ -32,26 +35,46 @@ else:
 daytona = Daytona(daytona_config)
 logger.debug("Daytona client initialized")
 
+# Environment and resources shared by every sandbox; only VNC_PASSWORD varies per call
+_BASE_ENV_VARS = MappingProxyType({
+    "CHROME_PERSISTENT_SESSION": "true",
+    "RESOLUTION": "1024x768x24",
+    "RESOLUTION_WIDTH": "1024",
+    "RESOLUTION_HEIGHT": "768",
+    "ANONYMIZED_TELEMETRY": "false",
+    "CHROME_PATH": "",
+    "CHROME_USER_DATA": "",
+    "CHROME_DEBUGGING_PORT": "9222",
+    "CHROME_DEBUGGING_HOST": "localhost",
+    "CHROME_CDP": ""
+})
+
+_BASE_RESOURCES = MappingProxyType({
+    "cpu": 2,
+    "memory": 4,
+    "disk": 5,
+})
+
 async def get_or_start_sandbox(sandbox_id: str):
     """Retrieve a sandbox by ID, check its state, and start it if needed."""
     
     logger.info(f"Getting or starting sandbox with ID: {sandbox_id}")
     
     try:
-        sandbox = daytona.get_current_sandbox(sandbox_id)
+        sandbox = await asyncio.to_thread(daytona.get_current_sandbox, sandbox_id)
         
         # Check if sandbox needs to be started
         if sandbox.instance.state == WorkspaceState.ARCHIVED or sandbox.instance.state == WorkspaceState.STOPPED:
             logger.info(f"Sandbox is in {sandbox.instance.state} state. Starting...")
             try:
-                daytona.start(sandbox)
+                await asyncio.to_thread(daytona.start, sandbox)
                 # Wait a moment for the sandbox to initialize
                 # sleep(5)
                 # Refresh sandbox state after starting
-                sandbox = daytona.get_current_sandbox(sandbox_id)
+                sandbox = await asyncio.to_thread(daytona.get_current_sandbox, sandbox_id)
                 
                 # Start supervisord in a session when restarting
-                start_supervisord_session(sandbox)
+                await asyncio.to_thread(start_supervisord_session, sandbox)
             except Exception as e:
                 logger.error(f"Error starting sandbox: {e}")
                 raise e
@@ -95,24 +118,8 @@ def create_sandbox(password: str, project_id: str = None):
         image=Configuration.SANDBOX_IMAGE_NAME,
         public=True,
         labels=labels,
-        env_vars={
-            "CHROME_PERSISTENT_SESSION": "true",
-            "RESOLUTION": "1024x768x24",
-            "RESOLUTION_WIDTH": "1024",
-            "RESOLUTION_HEIGHT": "768",
-            "VNC_PASSWORD": password,
-            "ANONYMIZED_TELEMETRY": "false",
-            "CHROME_PATH": "",
-            "CHROME_USER_DATA": "",
-            "CHROME_DEBUGGING_PORT": "9222",
-            "CHROME_DEBUGGING_HOST": "localhost",
-            "CHROME_CDP": ""
-        },
-        resources={
-            "cpu": 2,
-            "memory": 4,
-            "disk": 5,
-        }
+        env_vars={**_BASE_ENV_VARS, "VNC_PASSWORD": password},
+        resources=dict(_BASE_RESOURCES)
     )
     
     # Create the sandbox
@@ -131,10 +138,10 @@ async def delete_sandbox(sandbox_id: str):
     
     try:
         # Get the sandbox
-        sandbox = daytona.get_current_sandbox(sandbox_id)
+        sandbox = await asyncio.to_thread(daytona.get_current_sandbox, sandbox_id)
         
         # Delete the sandbox
-        daytona.remove(sandbox)
+        await asyncio.to_thread(daytona.remove, sandbox)
         
         logger.info(f"Successfully deleted sandbox {sandbox_id}")
         return True